@@ -4,43 +4,87 @@ Generate VST3 plugin icon with SNES ABXY buttons and musical note.
 
 Creates PlugIn.ico with multiple sizes.
 Renders programmatically with Pillow for gradient support.
-Requires: Pillow
-Install: pip install Pillow
+Requires: Pillow, NumPy
+Install: pip install Pillow numpy
+Optional: opencv-python (faster downsampling)
 """
 
+import argparse
 import math
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 try:
+	import numpy as np
 	from PIL import Image, ImageDraw, ImageFilter
 except ImportError as e:
 	print(f"Missing dependency: {e}")
-	print("Install with: pip install Pillow")
+	print("Install with: pip install Pillow numpy")
 	sys.exit(1)
 
+try:
+	import cv2
+except ImportError:
+	cv2 = None
+
 # Icon sizes for Windows ICO file
 ICO_SIZES = [256, 128, 64, 48, 32, 16]
 
 # PNG export sizes for reference/documentation
 PNG_SIZES = [512, 256, 128, 64, 32]
 
+# Reference PNGs favour encode speed over file size
+PNG_COMPRESS_LEVEL = 1
+
 # Note style variants
 NOTE_VARIANTS = ['A', 'B', 'C']
 
+VARIANT_DESCRIPTIONS = {
+	'A': 'Elegant flowing flags',
+	'B': 'Flowing ribbon-like flags',
+	'C': 'Classic notation style flags',
+}
 
-def lerp_color(c1: tuple, c2: tuple, t: float) -> tuple:
-	"""Linear interpolate between two colors."""
-	return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
+# Smallest size derived by downsampling the largest render; below this the
+# note's minimum stroke widths take over, so those sizes are drawn directly
+MIN_DOWNSAMPLED_SIZE = 128
 
 
-def bezier_point(p0, p1, p2, p3, t):
-	"""Calculate cubic bezier point."""
+def _bezier_weights(num_points: int) -> np.ndarray:
+	"""Cubic bezier basis weights, shape (num_points, 4)."""
+	t = np.linspace(0, 1, num_points)
 	u = 1 - t
-	return (
-		u*u*u*p0[0] + 3*u*u*t*p1[0] + 3*u*t*t*p2[0] + t*t*t*p3[0],
-		u*u*u*p0[1] + 3*u*u*t*p1[1] + 3*u*t*t*p2[1] + t*t*t*p3[1]
-	)
+	return np.column_stack((u*u*u, 3*u*u*t, 3*u*t*t, t*t*t))
+
+
+# Flag curves are always sampled at 61 points
+_BEZIER_WEIGHTS = _bezier_weights(61)
+
+
+def bezier_curve(p0, p1, p2, p3) -> np.ndarray:
+	"""Calculate points along a cubic bezier curve, shape (61, 2)."""
+	return _BEZIER_WEIGHTS @ np.array((p0, p1, p2, p3), dtype=np.float64)
+
+
+def _unit_circle(num_points: int) -> tuple:
+	"""(cos t, sin t) arrays for num_points evenly spaced angles."""
+	t = np.linspace(0, 2 * math.pi, num_points, endpoint=False)
+	return np.cos(t), np.sin(t)
+
+
+# Note head ellipses are always sampled at 80 points
+_ELLIPSE_COS, _ELLIPSE_SIN = _unit_circle(80)
+
+
+def ellipse_points(cx, cy, rx, ry, angle_deg) -> list:
+	"""Generate smooth points around a rotated ellipse."""
+	angle = math.radians(angle_deg)
+	ca, sa = math.cos(angle), math.sin(angle)
+	x = rx * _ELLIPSE_COS
+	y = ry * _ELLIPSE_SIN
+	return np.column_stack((cx + x * ca - y * sa, cy + x * sa + y * ca)).tolist()
 
 
 def draw_smooth_shape(draw, points, fill, outline=None, outline_width=0):
@@ -51,47 +95,76 @@ def draw_smooth_shape(draw, points, fill, outline=None, outline_width=0):
 	draw.polygon(points, fill=fill)
 
 
-def draw_gradient_circle(img: Image, cx: int, cy: int, r: int,
+@lru_cache(maxsize=None)
+def gradient_lut(highlight: tuple, main: tuple, shadow: tuple) -> np.ndarray:
+	"""Button colour for each of 256 gradient levels, shape (256, 3)."""
+	t = np.linspace(0, 1, 256)[:, None]
+	highlight, main, shadow = (np.array(c[:3], dtype=np.float64) for c in (highlight, main, shadow))
+	lut = np.where(
+		t < 0.4,
+		highlight + (main - highlight) * (t / 0.4),
+		main + (shadow - main) * ((t - 0.4) / 0.6)
+	).astype(np.uint8)
+	lut.flags.writeable = False
+	return lut
+
+
+def draw_gradient_circle(pixels: np.ndarray, cx: int, cy: int, r: int,
 						 highlight: tuple, main: tuple, shadow: tuple) -> None:
-	"""Draw a circle with radial gradient for 3D button effect."""
-	for y in range(cy - r - 2, cy + r + 3):
-		for x in range(cx - r - 2, cx + r + 3):
-			if x < 0 or y < 0 or x >= img.width or y >= img.height:
-				continue
-			dx = x - cx
-			dy = y - cy
-			dist = math.sqrt(dx * dx + dy * dy)
-
-			if dist <= r:
-				# Calculate gradient based on distance from highlight point (upper-left)
-				hx, hy = cx - r * 0.35, cy - r * 0.35
-				hdx = x - hx
-				hdy = y - hy
-				hdist = math.sqrt(hdx * hdx + hdy * hdy)
-				max_hdist = r * 1.7
-
-				t = min(1.0, hdist / max_hdist)
-
-				if t < 0.4:
-					color = lerp_color(highlight, main, t / 0.4)
-				else:
-					color = lerp_color(main, shadow, (t - 0.4) / 0.6)
-
-				# Anti-aliasing at edge
-				if dist > r - 1.5:
-					alpha = int(255 * max(0, min(1, (r - dist + 1.5) / 1.5)))
-					color = color + (alpha,)
-				else:
-					color = color + (255,)
-
-				img.putpixel((x, y), color)
-
-
-def draw_sixteenth_note(draw: ImageDraw, img: Image, cx: int, cy: int, scale: float, variant: str = 'A') -> None:
-	"""Draw a beautiful sixteenth note with two flowing flags and white outline."""
-	# Render at 4x size for anti-aliasing
-	aa_scale = 4
-	large_size = int(img.width * aa_scale)
+	"""Draw a circle with radial gradient for 3D button effect into an RGBA array."""
+	height, width = pixels.shape[:2]
+
+	# Bounding box, clipped to the image
+	x0 = max(0, cx - r - 2)
+	y0 = max(0, cy - r - 2)
+	x1 = min(width, cx + r + 3)
+	y1 = min(height, cy + r + 3)
+	if x0 >= x1 or y0 >= y1:
+		return
+
+	ys, xs = np.ogrid[y0:y1, x0:x1]
+
+	# Only pixels inside the circle are written; squared distances avoid a sqrt here
+	dx = xs - cx
+	dy = ys - cy
+	inside = dx * dx + dy * dy <= r * r
+
+	# Gradient based on distance from highlight point (upper-left)
+	hdx = xs - (cx - r * 0.35)
+	hdy = ys - (cy - r * 0.35)
+	hdist = np.sqrt((hdx * hdx + hdy * hdy)[inside])
+	t = np.minimum(1.0, hdist / (r * 1.7))
+
+	region = pixels[y0:y1, x0:x1]
+	region[inside, :3] = gradient_lut(highlight, main, shadow)[(t * 255).astype(np.uint8)]
+
+	# The 1.5px edge ramp, (r - dist + 1.5) / 1.5, never drops below 1 for
+	# dist <= r, so every pixel inside the circle is opaque
+	region[inside, 3] = 255
+
+
+def alpha_composite_array(dst: np.ndarray, src: np.ndarray) -> None:
+	"""Composite RGBA array src over dst in place (straight alpha)."""
+	src_a = src[..., 3:].astype(np.float32) / 255
+	dst_a = dst[..., 3:].astype(np.float32) / 255
+	dst_weight = dst_a * (1 - src_a)
+	out_a = src_a + dst_weight
+
+	rgb = src[..., :3] * src_a + dst[..., :3] * dst_weight
+	np.divide(rgb, out_a, out=rgb, where=out_a > 0)
+
+	dst[..., :3] = np.rint(rgb)
+	dst[..., 3:] = np.rint(out_a * 255)
+
+
+def draw_sixteenth_note(pixels: np.ndarray, cx: int, cy: int, scale: float, variant: str = 'A') -> None:
+	"""Draw a beautiful sixteenth note with two flowing flags and white outline into an RGBA array."""
+	size = pixels.shape[1]
+
+	# Supersample for anti-aliasing. 2x at 256px and up keeps the buffer a
+	# quarter of the 4x size, at the cost of slightly softer note edges
+	aa_scale = 2 if size >= 256 else 4
+	large_size = int(size * aa_scale)
 	large_img = Image.new('RGBA', (large_size, large_size), (0, 0, 0, 0))
 	large_draw = ImageDraw.Draw(large_img)
 
@@ -116,19 +189,6 @@ def draw_sixteenth_note(draw: ImageDraw, img: Image, cx: int, cy: int, scale: fl
 	stem_x = head_cx + int(head_rx * 0.65)
 	stem_top = lcy - int(58 * s)
 
-	# Generate smooth ellipse points
-	def ellipse_points(cx, cy, rx, ry, angle_deg, num_points=80):
-		angle = math.radians(angle_deg)
-		pts = []
-		for i in range(num_points):
-			t = 2 * math.pi * i / num_points
-			x = rx * math.cos(t)
-			y = ry * math.sin(t)
-			rotx = x * math.cos(angle) - y * math.sin(angle)
-			roty = x * math.sin(angle) + y * math.cos(angle)
-			pts.append((cx + rotx, cy + roty))
-		return pts
-
 	# Draw outline layer
 	outline_head = ellipse_points(head_cx, head_cy, head_rx + outline_w, head_ry + outline_w, head_angle)
 	large_draw.polygon(outline_head, fill=outline_color)
@@ -140,12 +200,7 @@ def draw_sixteenth_note(draw: ImageDraw, img: Image, cx: int, cy: int, scale: fl
 	], fill=outline_color)
 
 	# Flag outlines - smooth bezier curves
-	if variant == 'A':
-		_draw_flags_elegant(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=True)
-	elif variant == 'B':
-		_draw_flags_flowing(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=True)
-	else:
-		_draw_flags_classic(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=True)
+	draw_flags(large_draw, variant, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=True)
 
 	# Draw fill layer
 	fill_head = ellipse_points(head_cx, head_cy, head_rx, head_ry, head_angle)
@@ -155,159 +210,90 @@ def draw_sixteenth_note(draw: ImageDraw, img: Image, cx: int, cy: int, scale: fl
 	large_draw.rectangle([stem_x, stem_top, stem_x + stem_w, head_cy], fill=note_color)
 
 	# Flag fills
-	if variant == 'A':
-		_draw_flags_elegant(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=False)
-	elif variant == 'B':
-		_draw_flags_flowing(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=False)
-	else:
-		_draw_flags_classic(large_draw, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=False)
+	draw_flags(large_draw, variant, stem_x + stem_w, stem_top, s, outline_w, outline_color, note_color, outline=False)
 
 	# Downsample with high-quality resampling
-	small_note = large_img.resize((img.width, img.height), Image.LANCZOS)
-
-	# Composite onto main image
-	img.alpha_composite(small_note)
-
-
-def _draw_flags_elegant(draw, x, y, s, outline_w, outline_color, note_color, outline=False):
-	"""Elegant flowing flags with smooth S-curves."""
-	flag_len = int(38 * s)
-	flag_drop = int(45 * s)
-	flag_thick = int(11 * s)
-	spacing = int(18 * s)
-
-	for i in range(2):
-		fy = y + i * spacing
-
-		# Control points for smooth cubic bezier
-		p0 = (x, fy)
-		p1 = (x + flag_len * 0.4, fy + flag_drop * 0.1)
-		p2 = (x + flag_len * 0.7, fy + flag_drop * 0.6)
-		p3 = (x + flag_len, fy + flag_drop)
-
-		# Generate smooth curve points
-		top_curve = [bezier_point(p0, p1, p2, p3, t/60) for t in range(61)]
-
-		# Bottom curve (offset for thickness)
-		p0b = (x, fy + flag_thick)
-		p1b = (x + flag_len * 0.4, fy + flag_drop * 0.1 + flag_thick * 0.8)
-		p2b = (x + flag_len * 0.7, fy + flag_drop * 0.6 + flag_thick * 0.5)
-		p3b = (x + flag_len * 0.95, fy + flag_drop + flag_thick * 0.2)
-
-		bottom_curve = [bezier_point(p0b, p1b, p2b, p3b, t/60) for t in range(61)]
-		bottom_curve.reverse()
-
-		shape = top_curve + bottom_curve
-
-		if outline:
-			# Expand shape for outline
-			expanded = _expand_polygon(shape, outline_w)
-			draw.polygon(expanded, fill=outline_color)
-		else:
-			draw.polygon(shape, fill=note_color)
-
-
-def _draw_flags_flowing(draw, x, y, s, outline_w, outline_color, note_color, outline=False):
-	"""Flowing ribbon-like flags with gentle waves."""
-	flag_len = int(42 * s)
-	flag_drop = int(50 * s)
-	flag_thick = int(13 * s)
-	spacing = int(20 * s)
-
+	small_note = large_img.resize((size, size), Image.LANCZOS)
+
+	# Composite onto the buttons, touching only the note's footprint
+	bbox = small_note.getbbox()
+	if bbox:
+		x0, y0, x1, y1 = bbox
+		alpha_composite_array(pixels[y0:y1, x0:x1], np.asarray(small_note.crop(bbox)))
+
+
+# Flag geometry per variant at scale 1. Curve control points follow an
+# implicit (0, 0) start: top points are (x * length, y * drop), bottom
+# points are (x * length, y * drop + k * thickness) after a (0, thickness) start.
+_FLAG_STYLES = {
+	# Elegant flowing flags with smooth S-curves
+	'A': {
+		'length': 38, 'drop': 45, 'thickness': 11, 'spacing': 18,
+		'top': ((0.4, 0.1), (0.7, 0.6), (1.0, 1.0)),
+		'bottom': ((0.4, 0.1, 0.8), (0.7, 0.6, 0.5), (0.95, 1.0, 0.2)),
+	},
+	# Flowing ribbon-like flags with a more dramatic S-curve
+	'B': {
+		'length': 42, 'drop': 50, 'thickness': 13, 'spacing': 20,
+		'top': ((0.25, -0.1), (0.6, 0.7), (1.0, 0.85)),
+		'bottom': ((0.25, -0.1, 1.0), (0.6, 0.7, 0.6), (0.92, 0.85, 0.15)),
+	},
+	# Classic notation style flags with a tapered bottom
+	'C': {
+		'length': 35, 'drop': 40, 'thickness': 10, 'spacing': 16,
+		'top': ((0.5, 0.15), (0.85, 0.5), (1.0, 1.0)),
+		'bottom': ((0.5, 0.15, 0.9), (0.85, 0.5, 0.4), (0.9, 1.0, 0.1)),
+	},
+}
+
+
+def _flag_shapes(style: dict) -> list:
+	"""Outline polygons for both flags at scale 1, relative to the stem top-right corner."""
+	length, drop, thickness = style['length'], style['drop'], style['thickness']
+
+	shapes = []
 	for i in range(2):
-		fy = y + i * spacing
+		fy = i * style['spacing']
 
-		# More dramatic S-curve
-		p0 = (x, fy)
-		p1 = (x + flag_len * 0.25, fy - flag_drop * 0.1)
-		p2 = (x + flag_len * 0.6, fy + flag_drop * 0.7)
-		p3 = (x + flag_len, fy + flag_drop * 0.85)
+		top = [(0, fy)] + [(length * px, fy + drop * py) for px, py in style['top']]
+		bottom = [(0, fy + thickness)] + [
+			(length * px, fy + drop * py + thickness * pk) for px, py, pk in style['bottom']
+		]
 
-		top_curve = [bezier_point(p0, p1, p2, p3, t/60) for t in range(61)]
+		shapes.append(np.vstack((bezier_curve(*top), bezier_curve(*bottom)[::-1])))
+	return shapes
 
-		p0b = (x, fy + flag_thick)
-		p1b = (x + flag_len * 0.25, fy - flag_drop * 0.1 + flag_thick)
-		p2b = (x + flag_len * 0.6, fy + flag_drop * 0.7 + flag_thick * 0.6)
-		p3b = (x + flag_len * 0.92, fy + flag_drop * 0.85 + flag_thick * 0.15)
 
-		bottom_curve = [bezier_point(p0b, p1b, p2b, p3b, t/60) for t in range(61)]
-		bottom_curve.reverse()
+# Flags are evaluated once per variant and only scaled per render
+_FLAG_SHAPES = {variant: _flag_shapes(style) for variant, style in _FLAG_STYLES.items()}
 
-		shape = top_curve + bottom_curve
 
-		if outline:
-			expanded = _expand_polygon(shape, outline_w)
-			draw.polygon(expanded, fill=outline_color)
-		else:
-			draw.polygon(shape, fill=note_color)
-
-
-def _draw_flags_classic(draw, x, y, s, outline_w, outline_color, note_color, outline=False):
-	"""Classic musical notation style flags."""
-	flag_len = int(35 * s)
-	flag_drop = int(40 * s)
-	flag_thick = int(10 * s)
-	spacing = int(16 * s)
-
-	for i in range(2):
-		fy = y + i * spacing
-
-		# Traditional flag curve
-		p0 = (x, fy)
-		p1 = (x + flag_len * 0.5, fy + flag_drop * 0.15)
-		p2 = (x + flag_len * 0.85, fy + flag_drop * 0.5)
-		p3 = (x + flag_len, fy + flag_drop)
-
-		top_curve = [bezier_point(p0, p1, p2, p3, t/60) for t in range(61)]
-
-		# Tapered bottom
-		p0b = (x, fy + flag_thick)
-		p1b = (x + flag_len * 0.5, fy + flag_drop * 0.15 + flag_thick * 0.9)
-		p2b = (x + flag_len * 0.85, fy + flag_drop * 0.5 + flag_thick * 0.4)
-		p3b = (x + flag_len * 0.9, fy + flag_drop + flag_thick * 0.1)
-
-		bottom_curve = [bezier_point(p0b, p1b, p2b, p3b, t/60) for t in range(61)]
-		bottom_curve.reverse()
-
-		shape = top_curve + bottom_curve
+def draw_flags(draw, variant, x, y, s, outline_w, outline_color, note_color, outline=False):
+	"""Draw the two flags for a note variant with their top-left at (x, y)."""
+	for base in _FLAG_SHAPES[variant]:
+		shape = (base * s + (x, y)).tolist()
 
 		if outline:
-			expanded = _expand_polygon(shape, outline_w)
-			draw.polygon(expanded, fill=outline_color)
+			# Expand shape for outline
+			_draw_expanded_polygon(draw, shape, outline_w, outline_color)
 		else:
 			draw.polygon(shape, fill=note_color)
 
 
-def _expand_polygon(points, amount):
-	"""Expand a polygon outward by a given amount."""
-	# Simple expansion by moving each point outward from centroid
-	if len(points) < 3:
-		return points
-
-	# Calculate centroid
-	cx = sum(p[0] for p in points) / len(points)
-	cy = sum(p[1] for p in points) / len(points)
-
-	expanded = []
-	for px, py in points:
-		dx = px - cx
-		dy = py - cy
-		dist = math.sqrt(dx*dx + dy*dy)
-		if dist > 0:
-			nx = dx / dist
-			ny = dy / dist
-			expanded.append((px + nx * amount, py + ny * amount))
-		else:
-			expanded.append((px, py))
-
-	return expanded
+def _draw_expanded_polygon(draw, points, amount, fill):
+	"""Fill a polygon grown outward by amount on every side."""
+	draw.polygon(points, fill=fill)
+	# A closed stroke centred on the edge adds amount outside it, following
+	# concave curves instead of pushing points away from the centroid
+	draw.line(points + points[:1], fill=fill, width=amount * 2)
+	# Round caps at every vertex close the gaps between short wide segments
+	for x, y in points:
+		draw.ellipse((x - amount, y - amount, x + amount, y + amount), fill=fill)
 
 
 def render_icon(size: int, variant: str = 'A') -> Image:
 	"""Render the icon at the specified size with smooth anti-aliasing."""
-	img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-	draw = ImageDraw.Draw(img)
-
+	pixels = np.zeros((size, size, 4), dtype=np.uint8)
 	scale = size / 256.0
 
 	# Button positions and colors (Super Famicom)
@@ -324,12 +310,52 @@ def render_icon(size: int, variant: str = 'A') -> Image:
 	for cx, cy, highlight, main, shadow in buttons:
 		scx = int(cx * scale)
 		scy = int(cy * scale)
-		draw_gradient_circle(img, scx, scy, button_r, highlight, main, shadow)
+		draw_gradient_circle(pixels, scx, scy, button_r, highlight, main, shadow)
 
 	# Draw sixteenth note with smooth curves
-	draw_sixteenth_note(draw, img, int(128 * scale), int(128 * scale), scale, variant)
+	draw_sixteenth_note(pixels, int(128 * scale), int(128 * scale), scale, variant)
+
+	# Wrap the contiguous uint8 buffer without copying; it is not touched after this
+	return Image.frombuffer('RGBA', (size, size), pixels, 'raw', 'RGBA', 0, 1)
+
+
+def render_icon_sizes(sizes: list, variant: str = 'A') -> dict:
+	"""Render the icon at the largest size and downsample it where possible."""
+	master_size = max(sizes)
+	master = render_icon(master_size, variant)
+
+	icons = {}
+	for size in sizes:
+		if size == master_size:
+			icons[size] = master
+		elif size < MIN_DOWNSAMPLED_SIZE:
+			icons[size] = render_icon(size, variant)
+		else:
+			icons[size] = downsample(master, size)
+	return icons
+
 
-	return img
+def downsample(img: Image, size: int) -> Image:
+	"""Downsample an RGBA image to size x size, using OpenCV when available."""
+	if cv2 is None:
+		# Box-reduce most of the way, then LANCZOS the rest
+		return img.resize((size, size), Image.LANCZOS, reducing_gap=3.0)
+
+	# Pillow premultiplies alpha when resizing; OpenCV doesn't, so do it here
+	# to keep transparent pixels from bleeding dark fringes into the edges
+	pixels = np.asarray(img, dtype=np.float32)
+	pixels[..., :3] *= pixels[..., 3:] / 255
+
+	# INTER_AREA averages whole source pixels; LANCZOS4's fixed kernel
+	# aliases once the scale factor reaches 2
+	interpolation = cv2.INTER_AREA if img.width >= 2 * size else cv2.INTER_LANCZOS4
+	small = cv2.resize(pixels, (size, size), interpolation=interpolation)
+
+	np.clip(small, 0, 255, out=small)
+	alpha = small[..., 3:]
+	np.divide(small[..., :3] * 255, alpha, out=small[..., :3], where=alpha > 0)
+	np.clip(small, 0, 255, out=small)
+	return Image.fromarray(np.rint(small).astype(np.uint8), 'RGBA')
 
 
 def create_ico(images: list, ico_path: Path) -> None:
@@ -346,7 +372,53 @@ def create_ico(images: list, ico_path: Path) -> None:
 		print(f"  Created: {ico_path.name} with {len(images_sorted)} sizes")
 
 
-def main():
+def _variant_list(value: str) -> list:
+	"""Parse a comma-separated list of note variants."""
+	variants = [v.strip().upper() for v in value.split(',') if v.strip()]
+	unknown = [v for v in variants if v not in NOTE_VARIANTS]
+	if unknown or not variants:
+		raise argparse.ArgumentTypeError(f"variants must be drawn from {','.join(NOTE_VARIANTS)}")
+	return variants
+
+
+def _size_list(value: str) -> list:
+	"""Parse a comma-separated list of pixel sizes (empty for none)."""
+	try:
+		sizes = [int(v) for v in value.split(',') if v.strip()]
+	except ValueError:
+		raise argparse.ArgumentTypeError(f"invalid size list: {value!r}")
+	# Below this the buttons shrink to nothing; it is also the smallest ICO size
+	min_size = min(ICO_SIZES)
+	if any(size < min_size for size in sizes):
+		raise argparse.ArgumentTypeError(f"sizes must be at least {min_size}")
+	return sizes
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+	parser = argparse.ArgumentParser(description="Generate the SNES SPC VST3 plugin icon.")
+	parser.add_argument(
+		'--variants', type=_variant_list,
+		help="comma-separated note variants to generate (default: all, or only --default-variant if given)")
+	parser.add_argument(
+		'--sizes', type=_size_list, default=PNG_SIZES,
+		help="comma-separated reference PNG sizes; pass --sizes= to skip PNGs (default: %(default)s)")
+	parser.add_argument(
+		'--default-variant', choices=NOTE_VARIANTS,
+		help="write this variant as PlugIn.ico for the VST3 build instead of PlugIn-<variant>.ico")
+	args = parser.parse_args(argv)
+
+	if args.variants is None:
+		args.variants = [args.default_variant] if args.default_variant else list(NOTE_VARIANTS)
+	elif args.default_variant and args.default_variant not in args.variants:
+		args.variants.append(args.default_variant)
+	return args
+
+
+def main(argv=None):
+	args = parse_args(argv)
+	variants = args.variants
+	png_sizes = sorted(set(args.sizes), reverse=True)
+
 	script_dir = Path(__file__).parent
 	project_root = script_dir.parent
 	assets_dir = project_root / "assets" / "icons"
@@ -355,46 +427,53 @@ def main():
 	ico_dir = assets_dir
 	vst3_resource_dir = project_root / "vst3" / "resource"
 
-	png_dir.mkdir(parents=True, exist_ok=True)
-	vst3_resource_dir.mkdir(parents=True, exist_ok=True)
+	variant_dirs = {variant: png_dir / f"variant-{variant}" for variant in variants}
+	for directory in [ico_dir, vst3_resource_dir, *(variant_dirs.values() if png_sizes else [])]:
+		directory.mkdir(parents=True, exist_ok=True)
 
 	print("SNES SPC VST3 Icon Generator (Smooth Edition)")
 	print("=============================================")
 	print()
-	print("Generating 3 variants with anti-aliased curves:")
-	print("  A - Elegant flowing flags")
-	print("  B - Flowing ribbon-like flags")
-	print("  C - Classic notation style flags")
+	print(f"Generating {len(variants)} variant(s) with anti-aliased curves:")
+	for variant in variants:
+		print(f"  {variant} - {VARIANT_DESCRIPTIONS[variant]}")
 	print()
 
-	# Generate PNG files for each variant
-	for variant in NOTE_VARIANTS:
-		variant_dir = png_dir / f"variant-{variant}"
-		variant_dir.mkdir(parents=True, exist_ok=True)
+	# Every size needed by either output, derived from one render per variant
+	all_sizes = sorted(set(png_sizes) | set(ICO_SIZES), reverse=True)
 
-		print(f"Generating Variant {variant}...")
-		for size in PNG_SIZES:
-			png_path = variant_dir / f"snes-spc-icon-{variant}-{size}.png"
-			img = render_icon(size, variant)
-			img.save(png_path, 'PNG')
-			print(f"  {png_path.name} ({size}x{size})")
+	rendered = {variant: render_icon_sizes(all_sizes, variant) for variant in variants}
 
-	print()
+	# Generate PNG files for each variant
+	if png_sizes:
+		for variant in variants:
+			print(f"Generating Variant {variant}...")
+			for size in png_sizes:
+				png_path = variant_dirs[variant] / f"snes-spc-icon-{variant}-{size}.png"
+				rendered[variant][size].save(png_path, 'PNG', optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+				print(f"  {png_path.name} ({size}x{size})")
+
+		print()
 
 	# Generate ICO files for each variant
-	for variant in NOTE_VARIANTS:
+	for variant in variants:
 		print(f"Creating ICO Variant {variant}...")
-		ico_images = []
-		for size in ICO_SIZES:
-			img = render_icon(size, variant)
-			ico_images.append(img)
+		ico_images = [rendered[variant][size] for size in ICO_SIZES]
 
-		ico_path = ico_dir / f"PlugIn-{variant}.ico"
-		create_ico(ico_images, ico_path)
+		if variant == args.default_variant:
+			ico_path = ico_dir / "PlugIn.ico"
+			create_ico(ico_images, ico_path)
+			shutil.copyfile(ico_path, vst3_resource_dir / ico_path.name)
+			print(f"  Copied: {ico_path.name} to vst3/resource/")
+		else:
+			create_ico(ico_images, ico_dir / f"PlugIn-{variant}.ico")
 
 	print()
-	print("Done! Review variants in assets/icons/png/variant-*/")
-	print("Rename your preferred variant to PlugIn.ico")
+	if args.default_variant:
+		print(f"Done! Variant {args.default_variant} written to PlugIn.ico")
+	else:
+		print("Done! Review variants in assets/icons/png/variant-*/")
+		print("Rename your preferred variant to PlugIn.ico")
 
 
 if __name__ == "__main__":